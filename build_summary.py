@@ -0,0 +1,120 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Precompute every chart aggregate for main.py and store them as small Parquet files.
+# Run this again whenever heart.csv changes:  python build_summary.py
+
+DATA_PATH = 'input/heart-disease-dataset/heart.csv'
+
+# Human-readable labels for the coded categorical columns
+LABELS = {
+    'sex': {0: 'Female', 1: 'Male'},
+    'cp': {0: 'Typical angina', 1: 'Atypical angina', 2: 'Non-anginal pain', 3: 'Asymptomatic'},
+    'fbs': {0: '≤ 120 mg/dL', 1: '> 120 mg/dL'},
+    'target': {0: 'No Disease', 1: 'Disease'},
+}
+
+# Low-cardinality coded columns, stored as categoricals (int8 codes)
+CATEGORICAL_COLUMNS = ['sex', 'cp', 'fbs', 'target', 'restecg', 'exang', 'slope', 'ca', 'thal']
+
+# Narrowest dtypes that fit the measured columns. With the pyarrow engine pandas still
+# parses int64/float64 first and casts to these afterwards (frame.astype).
+DTYPES = {
+    'age': 'int8',
+    'trestbps': 'int16',
+    'chol': 'int16',
+    'thalach': 'int16',
+    'oldpeak': 'float32',
+    **{col: 'category' for col in CATEGORICAL_COLUMNS},
+}
+
+
+# pyarrow's multi-threaded reader; it is already pinned in requirements.txt
+def read_dataset(path):
+    data = pd.read_csv(path, engine='pyarrow', dtype=DTYPES)
+    # Add `<col>_label` columns once; the coded originals stay untouched
+    for col, labels in LABELS.items():
+        data[f'{col}_label'] = pd.Categorical(data[col].map(labels), categories=list(labels.values()))
+    return data
+
+
+# <row> x heart-disease contingency table in label order (one groupby pass)
+def target_crosstab(data, row):
+    ct = data.groupby([row, 'target_label'], observed=True).size().unstack(fill_value=0)
+    ct.index = ct.index.astype(str)
+    ct.columns = ct.columns.astype(str)
+    return ct
+
+
+def target_counts(data):
+    target = data['target'].value_counts().reindex(list(LABELS['target']), fill_value=0)
+    return pd.DataFrame(
+        {'count': target.to_numpy()},
+        index=pd.Index(list(LABELS['target'].values()), name='target'),
+    )
+
+
+def age_hist(data):
+    counts, edges = np.histogram(data['age'].to_numpy(), bins=20)
+    return pd.DataFrame({'left': edges[:-1], 'right': edges[1:], 'count': counts})
+
+
+# Resting BP density per gender over shared bin edges
+def bp_hist_by_sex(data):
+    edges = np.histogram_bin_edges(data['trestbps'], bins=40)
+    hist = pd.DataFrame({'left': edges[:-1], 'right': edges[1:]})
+    for code, sex in LABELS['sex'].items():
+        values = data.loc[data['sex'] == code, 'trestbps']
+        hist[sex] = np.histogram(values, bins=edges, density=True)[0]
+    return hist
+
+
+# Every chart aggregate by name; each is written to (and read back from) `<name>.parquet`.
+# Gender and chest-pain totals are the row sums of their crosstabs.
+AGGREGATES = {
+    'target_counts': target_counts,
+    'gender_target': lambda data: target_crosstab(data, 'sex_label'),
+    'age_hist': age_hist,
+    'bp_hist_by_sex': bp_hist_by_sex,
+    'cp_target': lambda data: target_crosstab(data, 'cp_label'),
+    'fbs_target': lambda data: target_crosstab(data, 'fbs_label'),
+}
+
+
+def build_summary(data):
+    return {name: aggregate(data) for name, aggregate in AGGREGATES.items()}
+
+
+# The summary lives in a `summary/` directory next to the CSV it was built from
+def summary_dir(data_path):
+    return os.path.join(os.path.dirname(data_path), 'summary')
+
+
+def summary_path(out_dir, name):
+    return os.path.join(out_dir, f'{name}.parquet')
+
+
+def write_summary(summary, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    for name, frame in summary.items():
+        frame.to_parquet(summary_path(out_dir, name))
+
+
+# Current means every aggregate in AGGREGATES has a file and none is older than the CSV
+def summary_is_current(data_path, out_dir):
+    paths = [summary_path(out_dir, name) for name in AGGREGATES]
+    if not all(os.path.isfile(path) for path in paths):
+        return False
+    return min(os.path.getmtime(path) for path in paths) >= os.path.getmtime(data_path)
+
+
+def read_summary(out_dir):
+    return {name: pd.read_parquet(summary_path(out_dir, name)) for name in AGGREGATES}
+
+
+if __name__ == '__main__':
+    out_dir = summary_dir(DATA_PATH)
+    write_summary(build_summary(read_dataset(DATA_PATH)), out_dir)
+    print(f"Wrote dashboard summary to {out_dir}")
@@ -1,10 +1,149 @@
-import pandas as pd
 import streamlit as st
 import os
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
 import io  # Needed for capturing data.info()
+from build_summary import LABELS, build_summary, read_dataset, read_summary, summary_dir, summary_is_current
+
+
+# Parse the CSV once and reuse it across Streamlit reruns
+@st.cache_data
+def load_data(path):
+    return read_dataset(path)
+
+
+# Chart aggregates come from the Parquet files written by build_summary.py when they
+# are complete and newer than the CSV; otherwise they are computed from the CSV and cached
+@st.cache_data
+def load_summary(path):
+    out_dir = summary_dir(path)
+    if summary_is_current(path, out_dir):
+        return read_summary(out_dir)
+    return build_summary(load_data(path))
+
+
+@st.cache_data
+def summary(df):
+    return df.describe(include='all')
+
+
+# Figures are built once per distinct input and reused across reruns.
+# cache_resource (not cache_data) so the Figure objects are reused rather than copied.
+# Plotting libraries are imported inside the factories to keep them off the cold start.
+@st.cache_resource
+def fig_target_counts(no_disease, disease):
+    import plotly.express as px
+
+    return px.bar(
+        x=['People without heart disease', 'People with heart disease'],
+        y=[no_disease, disease],
+        labels={'x': 'Condition', 'y': 'Number of People'},
+        title="People with heart disease vs People without heart disease"
+    )
+
+
+@st.cache_resource
+def fig_gender_dist(ct):
+    import plotly.express as px
+
+    totals = ct.sum(axis=1)
+    return px.bar(
+        x=totals.index,
+        y=totals.to_numpy(),
+        labels={'x': 'Gender', 'y': 'Count'},
+        title="Gender Distribution"
+    )
+
+
+@st.cache_resource
+def fig_gender_disease(ct):
+    import plotly.express as px
+
+    return px.bar(
+        ct,
+        barmode='group',
+        labels={'sex_label': 'Gender', 'value': 'Count', 'target_label': 'Heart Disease'},
+        title="Heart Disease Count by Gender"
+    )
+
+
+@st.cache_resource
+def fig_age_dist(hist):
+    import plotly.express as px
+
+    fig = px.bar(
+        x=(hist['left'] + hist['right']) / 2,
+        y=hist['count'],
+        labels={'x': 'Age', 'y': 'Frequency'},
+        title="Distribution of Age"
+    )
+    fig.update_traces(width=hist['right'] - hist['left'])
+    return fig
+
+
+# Totals and the by-disease split share one crosstab and render as one two-panel figure
+@st.cache_resource
+def fig_cp(ct):
+    import plotly.express as px
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        subplot_titles=("Chest Pain Type Distribution", "Chest Pain Type Distribution by Heart Disease")
+    )
+    fig.add_bar(
+        x=ct.index,
+        y=ct.sum(axis=1),
+        name="All patients",
+        marker_color='slategray',
+        showlegend=False,
+        row=1,
+        col=1
+    )
+    for target, color in zip(ct.columns, px.colors.qualitative.Set2):
+        fig.add_bar(x=ct.index, y=ct[target], name=target, marker_color=color, row=1, col=2)
+    fig.update_layout(barmode='group', legend_title_text="Heart Disease")
+    fig.update_xaxes(title_text="Chest Pain Type")
+    fig.update_yaxes(title_text="Number of People", row=1, col=1)
+    fig.update_yaxes(title_text="Number of Patients", row=1, col=2)
+    return fig
+
+
+@st.cache_resource
+def fig_fbs_by_target(ct):
+    import plotly.express as px
+
+    return px.bar(
+        ct,
+        barmode='group',
+        labels={'fbs_label': 'Fasting Blood Sugar Level', 'value': 'Patients Count', 'target_label': 'Heart Disease'},
+        title="Heart Disease Count by Fasting Blood Sugar"
+    )
+
+
+# Pre-binned density per gender (see build_summary.py) instead of a Gaussian KDE
+@st.cache_resource
+def fig_bp_by_gender(hist):
+    import plotly.express as px
+
+    density = hist.assign(trestbps=(hist['left'] + hist['right']) / 2).melt(
+        id_vars='trestbps',
+        value_vars=list(LABELS['sex'].values()),
+        var_name='sex_label',
+        value_name='density',
+    )
+    fig = px.bar(
+        density,
+        x='trestbps',
+        y='density',
+        color='sex_label',
+        barmode='overlay',
+        opacity=0.5,
+        labels={'trestbps': 'Resting Blood Pressure (mm Hg)', 'density': 'Density', 'sex_label': 'Gender'},
+        title="Resting Blood Pressure (trestbps) by Gender"
+    )
+    fig.update_traces(width=(hist['right'] - hist['left']).to_numpy())
+    return fig
+
 
 # Streamlit App Title
 st.title("❤️ Heart Disease Analysis")
@@ -19,7 +158,7 @@ This analysis follows a structured data workflow to explore and interpret the he
 #### B. Data Preprocessing
 - Handled categorical values (e.g., mapped `sex`, `cp`, `fbs`, `target` to human-readable labels).
 #### C. Exploratory Data Analysis 
-- Used visualizations (bar plots, histograms, KDE plots) to identify distributions.
+- Used visualizations (bar plots, histograms, density histograms) to identify distributions.
 - Compared chest pain types, fasting blood sugar, cholesterol, and blood pressure by gender and heart disease status.
 - Highlighted strong correlations between features like chest pain type and target (heart disease).
 #### D. Insights
@@ -30,7 +169,7 @@ This analysis follows a structured data workflow to explore and interpret the he
 - Used Streamlit to create an interactive app combining data, visualizations, and narrative.
 - Organized content for clarity: analysis section, insights section, and recommendations.
 
-> **Tools used**: Python, Pandas, Seaborn, Matplotlib, Plotly, Streamlit.
+> **Tools used**: Python, Pandas, NumPy, Plotly, Streamlit.
 """)
 
 #  Introduction
@@ -44,36 +183,37 @@ st.write(
 # Load the dataset
 file_path = 'input/heart-disease-dataset/heart.csv'
 
-if os.path.exists(file_path):
-    data = pd.read_csv(file_path)
+if not os.path.exists(file_path):
+    st.error("CSV file not found. Please check the path.")
+    st.stop()
 
-    # Show basic data info
-    st.subheader("Dataset Preview")
-    st.write("Top 5 Rows:")
-    st.dataframe(data.head())
+data = load_data(file_path)
+charts = load_summary(file_path)
 
-    st.write("Bottom 5 Rows:")
-    st.dataframe(data.tail())
+# The dataset sections show the source columns only, not the derived *_label ones
+dataset = data.drop(columns=[f'{col}_label' for col in LABELS])
 
-    st.write(f"Rows: {data.shape[0]}, Columns: {data.shape[1]}")
+# Show basic data info
+st.subheader("Dataset Preview")
+st.write("Top 5 Rows:")
+st.dataframe(dataset.head())
 
-    # Display dataset info using StringIO
-    st.subheader("Dataset Info")
-    buffer = io.StringIO()
-    data.info(buf=buffer)
-    info_str = buffer.getvalue()
-    st.text(info_str)
+st.write("Bottom 5 Rows:")
+st.dataframe(dataset.tail())
 
-else:
-    st.error("CSV file not found. Please check the path.")
+st.write(f"Rows: {dataset.shape[0]}, Columns: {dataset.shape[1]}")
 
-#data information
-if os.path.exists(file_path):
-    data = pd.read_csv(file_path)
+# Display dataset info using StringIO
+st.subheader("Dataset Info")
+buffer = io.StringIO()
+dataset.info(buf=buffer)
+info_str = buffer.getvalue()
+st.text(info_str)
 
-    st.subheader("Overall Statistics About the Dataset")
-    st.dataframe(data.describe(include='all'))
-    st.write("")
+#data information
+st.subheader("Overall Statistics About the Dataset")
+st.dataframe(summary(dataset))
+st.write("")
 
 # 2. Who is Most Affected?
 st.markdown("### 🔍 1. Who Is Most Affected?")
@@ -83,67 +223,36 @@ st.markdown("""
 > 🎯 **Insight**: Men-aged from 55 to 60 were the high-risk group.
 """)
     # Count how many have and don't have heart disease
-counts = data['target'].value_counts()
-st.write(f"People without heart disease: {counts[0]}")
-st.write(f"People with heart disease: {counts[1]}")
+no_disease, disease = charts['target_counts']['count'].tolist()
+st.markdown(f"People without heart disease: {no_disease}  \nPeople with heart disease: {disease}")
 
     # Create bar chart
-fig = px.bar(
-        x=['People without heart disease', 'People with heart disease'],
-        y=[counts[0], counts[1]],
-        labels={'x': 'Condition', 'y': 'Number of People'},
-        title="People with heart disease vs People without heart disease"
-    )
-st.plotly_chart(fig)
+st.plotly_chart(fig_target_counts(no_disease, disease), theme=None)
 
 #Find Count of Male & Female in this Dataset
 # Show gender counts
 st.subheader("Counts of Male & Female in this Dataset")
-gender_counts = data['sex'].value_counts()
-st.write(f"Female: {gender_counts[0]}")
-st.write(f"Male: {gender_counts[1]}")
+gender_ct = charts['gender_target']
+female, male = gender_ct.sum(axis=1).reindex(list(LABELS['sex'].values()), fill_value=0).tolist()
+st.markdown(f"Female: {female}  \nMale: {male}")
 
 # Plot gender distribution
-fig, ax = plt.subplots()
-sns.countplot(data=data, x='sex', ax=ax)
-ax.set_xticks([0, 1])
-ax.set_xticklabels(['Female', 'Male'])
-ax.set_title("Gender Distribution")
-st.pyplot(fig)
+st.plotly_chart(fig_gender_dist(gender_ct), theme=None)
 
 st.subheader("Which Gender Has More Heart Disease?")
 
-# Map sex values to labels (0 = female, 1 = male)
-data['sex'] = data['sex'].map({0: 'Female', 1: 'Male'})
-data['target'] = data['target'].map({0: 'No Disease', 1: 'Disease'})
-
 # Countplot of Heart Disease by Gender
-fig, ax = plt.subplots()
-sns.countplot(data=data, x='sex', hue='target', ax=ax)
-ax.set_title("Heart Disease Count by Gender")
-ax.set_xlabel("Gender")
-ax.set_ylabel("Count")
-st.pyplot(fig)
+st.plotly_chart(fig_gender_disease(gender_ct), theme=None)
 
 # Optional: Display numbers
 st.subheader("Heart Disease Counts by Gender")
-gender_disease_counts = data[data['target'] == 'Disease']['sex'].value_counts()
-st.write(gender_disease_counts)
+st.markdown("  \n".join(f"{sex}: {n}" for sex, n in gender_ct['Disease'].to_dict().items()))
 
 #age distribution by gender or heart disease status
 st.subheader("Age Distribution in the Dataset -Highest By 60years old were likely to have a heart disease")
 
-# Plot age distribution using Seaborn histplot
-fig, ax = plt.subplots()
-sns.histplot(data['age'], bins=20, kde=True, ax=ax)
-ax.set_title("Distribution of Age")
-ax.set_xlabel("Age")
-ax.set_ylabel("Frequency")
-st.pyplot(fig)
-
-# Plot the column bar chart
-plt.figure(figsize=(8, 5))
-sns.countplot(data=data, x='cp', palette='Set2')
+# Plot age distribution from the precomputed bin counts
+st.plotly_chart(fig_age_dist(charts['age_hist']), theme=None)
 
 # 3. Chest Pain Types
 st.markdown("### ❤️ 2. Chest Pain Types: A Silent Warning")
@@ -152,31 +261,8 @@ st.markdown("""
 > 🎯 **Insight**: People without symptoms may still be at serious risk!
 """)
 # Plot in Streamlit
-st.subheader("Chest Pain Type Distribution")
-fig, ax = plt.subplots(figsize=(8, 5))
-sns.countplot(data=data, x='cp', palette='Set2', ax=ax)
-ax.set_title("Chest Pain Type Distribution")
-ax.set_xlabel("Chest Pain Type")
-ax.set_ylabel("Number of People")
-ax.set_xticks([0, 1, 2, 3])
-ax.set_xticklabels(['Typical angina','Atypical angina','Non-anginal pain','Asymptomatic'], rotation=20)
-st.pyplot(fig)
-
-# Streamlit heading
-st.subheader("Chest Pain Type Distribution by Heart Disease")
-
-# Set up the plot
-fig, ax = plt.subplots(figsize=(8, 5))
-sns.countplot(data=data, x='cp', hue='target', palette='Set2', ax=ax)
-
-# Format axes
-ax.set_xticks([0, 1, 2, 3])
-ax.set_xticklabels(['Typical angina', 'Atypical angina', 'Non-anginal pain', 'Asymptomatic'], rotation=20)
-ax.set_xlabel("Chest Pain Type")
-ax.set_ylabel("Number of Patients")
-ax.set_title("Chest Pain Type Distribution by Heart Disease")
-ax.legend(title="Heart Disease", labels=["No-disease", "Disease"])
-st.pyplot(fig)
+st.subheader("Chest Pain Types and Heart Disease")
+st.plotly_chart(fig_cp(charts['cp_target']), theme=None)
 
 # 4. Fasting Blood Sugar
 st.markdown("### 🩸 3. Fasting Blood Sugar (FBS)")
@@ -185,20 +271,9 @@ st.markdown("""
 > 🎯 **Insight**: Still important for overall cardiovascular health, especially in diabetic patients.
 """)
 
-# Map once
-if data['fbs'].dtype in [int, float]:
-    data['fbs'] = data['fbs'].map({0: '≤ 120 mg/dL', 1: '> 120 mg/dL'})
-if data['target'].dtype in [int, float]:
-    data['target'] = data['target'].map({0: 'No Disease', 1: 'Disease'})
-
 # Plot
 st.subheader("Fasting Blood Sugar vs Heart Disease Status")
-fig, ax = plt.subplots()
-sns.countplot(data=data, x='fbs', hue='target', ax=ax)
-ax.set_title("Heart Disease Count by Fasting Blood Sugar")
-ax.set_xlabel("Fasting Blood Sugar Level")
-ax.set_ylabel("Patients Count")
-st.pyplot(fig)
+st.plotly_chart(fig_fbs_by_target(charts['fbs_target']), theme=None)
 
 # 5. Resting Blood Pressure
 st.markdown("### 🧘‍♂️ 4. Resting Blood Pressure")
@@ -207,23 +282,9 @@ st.markdown("""
 > 🎯 **Insight**: Target **~100 mm Hg** resting BP for prevention.
 """)
 
-# Safely map gender only if needed
-if data['sex'].dtype in [int, float]:
-    data['sex'] = data['sex'].map({0: 'Female', 1: 'Male'})
-
-# Drop NaNs from trestbps and sex
-plot_data = data[['trestbps', 'sex']].dropna()
-
 # Plot in Streamlit
 st.subheader("🩺 Resting Blood Pressure Distribution by Gender")
-
-fig, ax = plt.subplots(figsize=(10, 5))
-sns.kdeplot(data=plot_data, x='trestbps', hue='sex', fill=True, ax=ax)
-
-ax.set_title("Resting Blood Pressure (trestbps) by Gender")
-ax.set_xlabel("Resting Blood Pressure (mm Hg)")
-ax.set_ylabel("Density")
-st.pyplot(fig)
+st.plotly_chart(fig_bp_by_gender(charts['bp_hist_by_sex']), theme=None)
 
 # 6. Top Risk Factor Table
 st.markdown("### 📊 Top Risk Factors (Based on Visual Trends)")